@@ -1,18 +1,52 @@
 import os
 import json
-import torch
 import logging
 from typing import Optional
 from dataclasses import dataclass, field, asdict
-from functools import cached_property
+from functools import cache, cached_property
 
 from muben.utils.macro import MODEL_NAMES, UncertaintyMethods
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["Arguments", "Config"]
 
 
+def _load_json(content: bytes):
+    """
+    Decode UTF-8 encoded json content, using `orjson` if it is installed
+    """
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+@cache
+def _cuda_available() -> bool:
+    """
+    Probe the CUDA driver only once per process
+    """
+    import torch
+
+    return torch.cuda.is_available()
+
+
+@cache
+def _mps_available() -> bool:
+    """
+    Probe the MPS backend only once per process
+    """
+    import torch
+
+    try:
+        return torch.backends.mps.is_available()
+    except AttributeError:
+        return False
+
+
 @dataclass
 class Arguments:
     """
@@ -209,7 +243,7 @@ class Arguments:
         default=8, metadata={"help": 'The number of threads to process the dataset.'}
     )
     pin_memory: Optional[bool] = field(
-        default=False, metadata={"help": "Pin memory for data loader."}
+        default=None, metadata={"help": "Pin memory for data loader. Pin memory by default when training on CUDA."}
     )
     n_feature_generating_threads: Optional[int] = field(
         default=8, metadata={'help': "Number of feature generation threads"}
@@ -241,14 +275,9 @@ class Arguments:
         """
         The device used by this process.
         """
-        try:
-            mps_available = torch.backends.mps.is_available()
-        except AttributeError:
-            mps_available = False
-
-        if mps_available and not self.no_mps:
+        if not self.no_mps and _mps_available():
             device = "mps"
-        elif self.no_cuda or not torch.cuda.is_available():
+        elif self.no_cuda or not _cuda_available():
             device = "cpu"
         else:
             device = "cuda"
@@ -265,7 +294,7 @@ class Config(Arguments):
     n_tasks = None
     eval_metric = None
 
-    @cached_property
+    @property
     def n_lbs(self):
         if self.task_type == 'classification':
             if len(self.classes) == 2:
@@ -275,7 +304,7 @@ class Config(Arguments):
         elif self.task_type == 'regression':
             return 2 if self.regression_with_variance else 1
         else:
-            ValueError(f"Unrecognized task type: {self.task_type}")
+            raise ValueError(f"Unrecognized task type: {self.task_type}")
 
     def get_meta(self,
                  meta_dir: Optional[str] = None,
@@ -283,19 +312,20 @@ class Config(Arguments):
 
         if meta_dir is not None:
             meta_dir = meta_dir
-        elif 'data_dir' in dir(self):
+        elif hasattr(self, 'data_dir'):
             meta_dir = getattr(self, 'data_dir')
         else:
             raise ValueError("To automatically load meta file, please either specify "
                              "the `meta_dir` argument or define a `data_dir` class attribute.")
 
         meta_dir = os.path.join(meta_dir, meta_file_name)
-        with open(meta_dir, 'r', encoding='utf-8') as f:
-            meta_dict = json.load(f)
+        with open(meta_dir, 'rb') as f:
+            meta_dict = _load_json(f.read())
 
+        valid_keys = set(dir(self))
         invalid_keys = list()
         for k, v in meta_dict.items():
-            if k in dir(self):
+            if k in valid_keys:
                 setattr(self, k, v)
             else:
                 invalid_keys.append(k)
@@ -317,8 +347,8 @@ class Config(Arguments):
         -------
         self (type: BertConfig)
         """
-        arg_elements = {attr: getattr(args, attr) for attr in dir(args) if not callable(getattr(args, attr))
-                        and not attr.startswith("__") and not attr.startswith("_")}
+        # instance attributes cover both dataclass fields and those assigned in `__post_init__`
+        arg_elements = {attr: value for attr, value in vars(args).items() if not attr.startswith("_")}
         for attr, value in arg_elements.items():
             try:
                 setattr(self, attr, value)
@@ -402,8 +432,12 @@ class Config(Arguments):
             raise FileNotFoundError(f"{file_dir} does not exist!")
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self), f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(asdict(self), option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(asdict(self), f, ensure_ascii=False, indent=2)
         except Exception as e:
             logger.exception(f"Cannot save config file to {file_path}; "
                              f"encountered Error {e}")
@@ -433,8 +467,8 @@ class Config(Arguments):
 
         logger.info(f'Setting {type(self)} parameters from {file_path}.')
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        with open(file_path, 'rb') as f:
+            config = _load_json(f.read())
         for attr, value in config.items():
             try:
                 setattr(self, attr, value)
@@ -1,5 +1,6 @@
 import os
-import regex
+import re
+import json
 import torch
 import logging
 import pandas as pd
@@ -13,7 +14,11 @@ from torch.utils.data import Dataset as TorchDataset
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["Dataset", "Batch", "pack_instances", "unpack_instances"]
+__all__ = ["Dataset", "Batch", "pack_instances", "unpack_instances", "parse_list_column"]
+
+# Python's `repr` of non-finite floats, which is not valid JSON
+_NAN_PATTERN = re.compile(r"\bnan\b")
+_INF_PATTERN = re.compile(r"\binf\b")
 
 
 class Dataset(TorchDataset):
@@ -36,7 +41,7 @@ class Dataset(TorchDataset):
 
     @cached_property
     def masks(self) -> np.ndarray:
-        return self._masks if self._masks is not None else np.ones_like(self.lbs).astype(int)
+        return self._masks if self._masks is not None else np.ones(self.lbs.shape, dtype=np.int8)
 
     def __len__(self):
         return len(self._smiles)
@@ -48,7 +53,7 @@ class Dataset(TorchDataset):
         """
         Update dataset labels and instance list accordingly
         """
-        self._lbs = lbs
+        self._lbs = np.asarray(lbs, dtype=np.float32)
         self.data_instances = self.get_instances()
         return self
 
@@ -72,12 +77,17 @@ class Dataset(TorchDataset):
         method_identifier = f"{config.model_name}-{config.feature_type}" \
             if config.feature_type != 'none' else config.model_name
         preprocessed_path = os.path.normpath(os.path.join(
-            config.data_dir, "processed", method_identifier, f"{partition}.pt"
+            config.data_dir, "processed", method_identifier, partition
         ))
-        # Load Pre-processed dataset if exist
-        if os.path.exists(preprocessed_path) and not config.ignore_preprocessed_dataset:
+        legacy_preprocessed_path = f"{preprocessed_path}.pt"
+
+        # Load Pre-processed dataset if exist; `attrs.pt` is written last and marks a completed save
+        if os.path.isfile(os.path.join(preprocessed_path, "attrs.pt")) and not config.ignore_preprocessed_dataset:
             logger.info(f"Loading pre-processed dataset {preprocessed_path}")
             self.load(preprocessed_path)
+        elif os.path.isfile(legacy_preprocessed_path) and not config.ignore_preprocessed_dataset:
+            logger.info(f"Loading pre-processed dataset {legacy_preprocessed_path}")
+            self.load(legacy_preprocessed_path)
         # else, load dataset from csv and generate features
         else:
             self.read_csv(config.data_dir, partition)
@@ -110,35 +120,73 @@ class Dataset(TorchDataset):
 
     def save(self, file_path: str):
         """
-        Save the entire dataset for future usage
+        Save the entire dataset for future usage.
+
+        Numerical arrays are saved as separate `.npy` files so that they can be memory-mapped when loading,
+        SMILES strings are saved as a text file with one molecule per line,
+        and the remaining attributes are pickled together with the names of the array and text attributes.
+        The pickled file is written last so that its presence marks a completed save.
+
         Parameters
         ----------
-        file_path: path to the saved file
+        file_path: path to the directory that holds the saved files
         Returns
         -------
         self
         """
+        os.makedirs(os.path.normpath(file_path), exist_ok=True)
+        # invalidate any previous save before overwriting its files
+        attrs_file_path = os.path.join(file_path, "attrs.pt")
+        if os.path.exists(attrs_file_path):
+            os.remove(attrs_file_path)
+
         attr_dict = dict()
+        array_attrs = list()
+        text_attrs = list()
         for attr, value in self.__dict__.items():
-            if regex.match(f"^_[a-z]", attr):
+            # only save private data attributes, i.e., those matching `^_[a-z]`
+            if not (len(attr) > 1 and attr[0] == '_' and attr[1].islower()):
+                continue
+
+            if isinstance(value, np.ndarray) and value.dtype != object:
+                np.save(os.path.join(file_path, f"{attr}.npy"), value, allow_pickle=False)
+                array_attrs.append(attr)
+            elif attr == '_smiles' and value is not None:
+                with open(os.path.join(file_path, f"{attr}.txt"), 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(value))
+                text_attrs.append(attr)
+            else:
                 attr_dict[attr] = value
 
-        os.makedirs(os.path.dirname(os.path.normpath(file_path)), exist_ok=True)
-        torch.save(attr_dict, file_path)
+        torch.save({'attrs': attr_dict, 'array_attrs': array_attrs, 'text_attrs': text_attrs}, attrs_file_path)
 
         return self
 
     def load(self, file_path: str):
         """
-        Load the entire dataset from disk
+        Load the entire dataset from disk.
+
+        Numerical arrays are memory-mapped in copy-on-write mode, so modifying them does not touch the saved files.
+        Datasets saved as a single `.pt` file by earlier versions are still supported.
+
         Parameters
         ----------
-        file_path: path to the saved file
+        file_path: path to the saved directory or legacy `.pt` file
         Returns
         -------
         self
         """
-        attr_dict = torch.load(file_path)
+        if os.path.isdir(file_path):
+            saved = torch.load(os.path.join(file_path, "attrs.pt"))
+            attr_dict = saved['attrs']
+            # only read the files written by the latest save
+            for attr in saved['array_attrs']:
+                attr_dict[attr] = np.load(os.path.join(file_path, f"{attr}.npy"), mmap_mode='c')
+            for attr in saved['text_attrs']:
+                with open(os.path.join(file_path, f"{attr}.txt"), 'r', encoding='utf-8') as f:
+                    attr_dict[attr] = f.read().splitlines()
+        else:
+            attr_dict = torch.load(file_path)
 
         for attr, value in attr_dict.items():
             if attr not in self.__dict__:
@@ -160,8 +208,8 @@ class Dataset(TorchDataset):
 
         df = pd.read_csv(file_path)
         self._smiles = df.smiles.tolist()
-        self._lbs = np.asarray(df.labels.map(literal_eval).to_list())
-        self._masks = np.asarray(df.masks.map(literal_eval).to_list()) if not df.masks.isnull().all() else None
+        self._lbs = parse_list_column(df.labels, dtype=np.float32)
+        self._masks = parse_list_column(df.masks, dtype=np.int8) if not df.masks.isnull().all() else None
 
         return self
 
@@ -178,9 +226,20 @@ class Batch:
         if isinstance(v, torch.Tensor) or callable(getattr(v, "to", None)):
             self._tensor_members[k] = v
 
-    def to(self, device):
+    def to(self, device, non_blocking=False):
+        for k, v in self._tensor_members.items():
+            setattr(self, k, v.to(device, non_blocking=non_blocking))
+        return self
+
+    def pin_memory(self):
+        """
+        Called by the DataLoader to pin tensor members when `pin_memory` is enabled;
+        otherwise, custom batch types are returned unpinned.
+        """
         for k, v in self._tensor_members.items():
-            setattr(self, k, v.to(device))
+            v = v.pin_memory()
+            setattr(self, k, v)
+            self._tensor_members[k] = v
         return self
 
     def __len__(self):
@@ -203,6 +262,26 @@ def pack_instances(**kwargs) -> list[dict]:
     return instance_list
 
 
+def parse_list_column(column: pd.Series, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """
+    Convert a dataframe column of stringified lists (e.g., "[0, 1]") to a numpy array of type `dtype`.
+
+    The whole column is parsed as one JSON array in a single call, with Python's `nan` and `inf`
+    converted to their JSON counterparts `NaN` and `Infinity` beforehand. Cells containing other
+    Python-only literals (`True`/`False`/`None`, single-quoted strings, tuples) are not valid JSON,
+    in which case we fall back to parsing each cell with `literal_eval`.
+    """
+    if column.dtype != object:
+        return np.asarray(column.to_list(), dtype=dtype)
+
+    content = f"[{','.join(column.values)}]"
+    content = _INF_PATTERN.sub("Infinity", _NAN_PATTERN.sub("NaN", content))
+    try:
+        return np.asarray(json.loads(content), dtype=dtype)
+    except (json.JSONDecodeError, TypeError):
+        return np.asarray(column.map(literal_eval).to_list(), dtype=dtype)
+
+
 def unpack_instances(instance_list: list[dict], attr_names: Optional[list[str]] = None):
     """
     Convert a list of dict-type instances to a list of value lists,
@@ -153,9 +153,10 @@ class Trainer:
 
         # for sgld compatibility
         if self.config.uncertainty_method == UncertaintyMethods.sgld:
-            output_param_ids = [id(x[1]) for x in self._model.named_parameters() if "output_layer" in x[0]]
-            base_params = filter(lambda p: id(p) not in output_param_ids, self._model.parameters())
-            output_params = filter(lambda p: id(p) in output_param_ids, self._model.parameters())
+            base_params = list()
+            output_params = list()
+            for name, param in self._model.named_parameters():
+                (output_params if "output_layer" in name else base_params).append(param)
 
             self._optimizer = AdamW(base_params, lr=self._status.lr)
             sgld_optimizer = PSGLDOptimizer if self.config.apply_preconditioned_sgld else SGLDOptimizer
@@ -563,7 +564,8 @@ class Trainer:
         data_loader = self.get_dataloader(
             self.training_dataset if not use_valid_dataset else self.valid_dataset,
             shuffle=True,
-            batch_size=self.config.batch_size
+            batch_size=self.config.batch_size,
+            persistent=True
         )
 
         for epoch_idx in range(self._status.n_epochs):
@@ -615,7 +617,7 @@ class Trainer:
         time_per_step_list = list()
 
         for batch in data_loader:
-            batch.to(self._device)
+            batch.to(self._device, non_blocking=True)
 
             self._optimizer.zero_grad()
             if self._sgld_optimizer is not None:  # for sgld compatibility
@@ -712,7 +714,7 @@ class Trainer:
 
         with torch.no_grad():
             for batch in dataloader:
-                batch.to(self._device)
+                batch.to(self._device, non_blocking=True)
 
                 logits = self.model(batch)
                 logits_list.append(logits.detach().cpu())
@@ -959,16 +961,31 @@ class Trainer:
     def get_dataloader(self,
                        dataset,
                        shuffle: Optional[bool] = False,
-                       batch_size: Optional[int] = 0):
+                       batch_size: Optional[int] = 0,
+                       persistent: Optional[bool] = False):
+        """
+        Build a data loader for `dataset`.
+
+        Set `persistent` for the training loader only: its workers are then kept alive across epochs
+        and prepare batches ahead of the training loop.
+        """
+        num_workers = getattr(self.config, "num_workers", 0)
+        # pin memory on CUDA unless the user sets `pin_memory` explicitly
+        pin_memory = getattr(self.config, "pin_memory", None)
+        if pin_memory is None:
+            pin_memory = self._device == "cuda"
+        prefetch_kwargs = {"persistent_workers": True, "prefetch_factor": 4} \
+            if persistent and num_workers > 0 else dict()
         try:
             dataloader = DataLoader(
                 dataset=dataset,
                 collate_fn=self._collate_fn,
                 batch_size=batch_size if batch_size else self.config.batch_size,
-                num_workers=getattr(self.config, "num_workers", 0),
-                pin_memory=getattr(self.config, "pin_memory", False),
+                num_workers=num_workers,
+                pin_memory=pin_memory,
                 shuffle=shuffle,
-                drop_last=False
+                drop_last=False,
+                **prefetch_kwargs
             )
         except Exception as e:
             logger.exception(e)
@@ -1,9 +1,9 @@
 import torch
 import logging
 import numpy as np
-from transformers import AutoTokenizer
 
 from muben.base.dataset import Batch, unpack_instances
+from .dataset import get_tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,7 @@ class Collator:
         self._task = config.task_type
         self._lbs_type = torch.float
 
-        tokenizer = AutoTokenizer.from_pretrained(config.pretrained_model_name_or_path)
+        tokenizer = get_tokenizer(config.pretrained_model_name_or_path)
         self._pad_id = tokenizer.pad_token_id
 
     def __call__(self, instance_list: list, *args, **kwargs) -> Batch:
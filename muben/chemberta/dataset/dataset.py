@@ -1,5 +1,6 @@
 import logging
 
+from functools import lru_cache
 from transformers import AutoTokenizer
 from muben.base.dataset import (
     pack_instances,
@@ -9,6 +10,14 @@ from muben.base.dataset import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def get_tokenizer(tokenizer_name: str):
+    """
+    Load the fast tokenizer once and share it across dataset partitions and collators
+    """
+    return AutoTokenizer.from_pretrained(tokenizer_name, use_fast=True)
+
+
 class Dataset(BaseDataset):
     def __init__(self):
         super().__init__()
@@ -24,10 +33,20 @@ class Dataset(BaseDataset):
         self
         """
         tokenizer_name = config.pretrained_model_name_or_path
-        tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
-        tokenized_instances = tokenizer(self._smiles, add_special_tokens=True, truncation=True)
+        tokenizer = get_tokenizer(tokenizer_name)
+        if not tokenizer.is_fast:
+            logger.warning(f"No fast tokenizer is available for {tokenizer_name}; tokenization may be slow.")
+
+        tokenized_instances = tokenizer(
+            self._smiles,
+            add_special_tokens=True,
+            truncation=True,
+            return_attention_mask=False,
+            return_token_type_ids=False
+        )
 
         self._atom_ids = tokenized_instances.input_ids
+        return self
 
     def get_instances(self):
 
@@ -1,7 +1,6 @@
 import logging
 from typing import Optional
 from dataclasses import dataclass, field
-from functools import cached_property
 from muben.base.args import (
     Arguments as BaseArguments,
     Config as BaseConfig
@@ -46,7 +45,7 @@ class Arguments(BaseArguments):
 @dataclass
 class Config(Arguments, BaseConfig):
 
-    @cached_property
+    @property
     def d_feature(self):
         if self.feature_type == 'rdkit':
             return 200
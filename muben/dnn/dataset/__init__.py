@@ -1,4 +1,4 @@
-from .dataset import Dataset
+from .dataset import Dataset, close_feature_pool
 from .collate import Collator
 
-__all__ = ["Dataset", "Collator"]
+__all__ = ["Dataset", "Collator", "close_feature_pool"]
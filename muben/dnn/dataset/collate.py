@@ -1,6 +1,5 @@
 import torch
 import logging
-import numpy as np
 
 from muben.base.dataset import Batch, unpack_instances
 
@@ -27,8 +26,8 @@ class Collator:
         """
         features, lbs, masks = unpack_instances(instance_list)
 
-        feature_batch = torch.from_numpy(np.stack(features)).to(torch.float)
-        lbs_batch = torch.from_numpy(np.stack(lbs)).to(self._lbs_type)
-        masks_batch = torch.from_numpy(np.stack(masks))
+        feature_batch = torch.stack(features).to(torch.float)
+        lbs_batch = torch.stack(lbs).to(self._lbs_type)
+        masks_batch = torch.stack(masks)
 
         return Batch(features=feature_batch, lbs=lbs_batch, masks=masks_batch)
@@ -1,13 +1,12 @@
+import atexit
+import torch
 import logging
 import numpy as np
 
 from tqdm.auto import tqdm
 from multiprocessing import get_context
 
-from muben.base.dataset import (
-    pack_instances,
-    Dataset as BaseDataset
-)
+from muben.base.dataset import Dataset as BaseDataset
 from .features import (
     rdkit_2d_features_normalized_generator,
     morgan_binary_features_generator
@@ -15,6 +14,49 @@ from .features import (
 
 logger = logging.getLogger(__name__)
 
+# feature generation pool shared by all dataset partitions to amortize the worker start-up cost
+_feature_pool = None
+_feature_pool_n_workers = 0
+
+
+def _init_feature_worker():
+    """
+    Import the feature generation backends once per worker instead of once per molecule
+    """
+    try:
+        import rdkit.Chem.AllChem  # noqa: F401
+        import descriptastorus.descriptors.rdNormalizedDescriptors  # noqa: F401
+    except ImportError:
+        pass
+
+
+def close_feature_pool():
+    """
+    Shut down the feature generation pool. Call this once all dataset partitions are prepared
+    so that the idle workers do not outlive the pre-processing stage.
+    """
+    global _feature_pool, _feature_pool_n_workers
+    if _feature_pool is not None:
+        _feature_pool.close()
+        _feature_pool.join()
+        _feature_pool = None
+        _feature_pool_n_workers = 0
+
+
+def get_feature_pool(n_workers: int):
+    """
+    Get the persistent feature generation pool, creating it if necessary
+    """
+    global _feature_pool, _feature_pool_n_workers
+    if _feature_pool is None or _feature_pool_n_workers != n_workers:
+        close_feature_pool()
+        _feature_pool = get_context('fork').Pool(n_workers, initializer=_init_feature_worker)
+        _feature_pool_n_workers = n_workers
+    return _feature_pool
+
+
+atexit.register(close_feature_pool)
+
 
 class Dataset(BaseDataset):
     def __init__(self):
@@ -38,24 +80,40 @@ class Dataset(BaseDataset):
         feature_type = config.feature_type
         if feature_type == 'rdkit':
             logger.info("Generating normalized RDKit features")
-            with get_context('fork').Pool(config.num_preprocess_workers) as pool:
-                self._features = [f for f in tqdm(
-                    pool.imap(rdkit_2d_features_normalized_generator, self._smiles), total=len(self._smiles)
-                )]
+            feature_generator = rdkit_2d_features_normalized_generator
         elif feature_type == 'morgan':
             logger.info("Generating Morgan binary features")
-            with get_context('fork').Pool(config.num_preprocess_workers) as pool:
-                self._features = [f for f in tqdm(
-                        pool.imap(morgan_binary_features_generator, self._smiles), total=len(self._smiles)
-                )]
+            feature_generator = morgan_binary_features_generator
         else:
-            self._features = np.empty(len(self)) * np.nan
+            self._features = np.full(len(self), np.nan, dtype=np.float32)
+            return self
+
+        if len(self._smiles) == 0:
+            self._features = np.zeros((0, config.d_feature), dtype=np.float32)
+            return self
+
+        n_workers = config.num_preprocess_workers
+        # send molecules to workers in chunks to reduce the inter-process communication overhead
+        chunksize = max(1, len(self._smiles) // (n_workers * 8))
+        pool = get_feature_pool(n_workers)
+        self._features = np.stack([f for f in tqdm(
+            pool.imap(feature_generator, self._smiles, chunksize=chunksize), total=len(self._smiles)
+        )])
         return self
 
-    def get_instances(self):
+    def __getitem__(self, idx):
+        return {k: v[idx] for k, v in self.data_instances.items()}
 
-        data_instances = pack_instances(
-            features=self._features, lbs=self.lbs, masks=self.masks
-        )
+    def get_instances(self):
+        """
+        Keep the data attributes as columnar tensors instead of a list of per-instance dicts.
+        `torch.from_numpy` shares memory with the attributes that are already numpy arrays;
+        list-type attributes (e.g., features loaded from a legacy `.pt` cache) are copied once into an array.
+        """
+        data_instances = {
+            'features': torch.from_numpy(np.asarray(self._features)),
+            'lbs': torch.from_numpy(np.asarray(self.lbs)),
+            'masks': torch.from_numpy(np.asarray(self.masks))
+        }
 
         return data_instances
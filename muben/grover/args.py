@@ -65,6 +65,12 @@ class Arguments(BaseArguments):
         metadata={'help': 'The dist coefficient for output of two branches.'}
     )
 
+    # Device arguments
+    disable_model_warmup: Optional[bool] = field(
+        default=False,
+        metadata={'help': 'Do not run a dummy forward pass on GPU after loading the model checkpoint.'}
+    )
+
     def __post_init__(self):
         super().__post_init__()
         self.disable_dataset_saving = True
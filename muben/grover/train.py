@@ -3,8 +3,6 @@ from abc import ABC
 import torch
 import logging
 import numpy as np
-import torch.nn.functional as F
-from scipy.special import expit
 
 from .dataset import Collator
 from .args import Config
@@ -15,6 +13,9 @@ from muben.base.train import Trainer as BaseTrainer
 
 logger = logging.getLogger(__name__)
 
+# CUDA kernel loading and cuBLAS/cuDNN initialization happen once per process
+_cuda_warmed_up = False
+
 
 class Trainer(BaseTrainer, ABC):
     def __init__(self,
@@ -43,6 +44,37 @@ class Trainer(BaseTrainer, ABC):
         logger.info(f"Loading GROVER checkpoint from {self.config.checkpoint_path}")
         self._model = load_checkpoint(self.config)
 
+        if not self.config.disable_model_warmup:
+            self.warmup()
+
+    def warmup(self):
+        """
+        Run one forward pass on a small batch so that CUDA kernel loading and
+        cuBLAS/cuDNN initialization do not stall the first training step.
+        Only the first call in a process runs the forward pass.
+        """
+        global _cuda_warmed_up
+        if self._device != 'cuda' or _cuda_warmed_up:
+            return self
+
+        dataset = next((ds for ds in (self._training_dataset, self._valid_dataset, self._test_dataset)
+                        if ds is not None and len(ds) > 0), None)
+        if dataset is None:
+            return self
+
+        logger.info("Warming up the GROVER model on GPU")
+        batch = self._collate_fn([dataset[idx] for idx in range(min(2, len(dataset)))])
+        batch.to(self._device)
+
+        self._model.to(self._device)
+        self._model.eval()
+        with torch.no_grad():
+            self._model(batch)
+        torch.cuda.synchronize()
+        _cuda_warmed_up = True
+
+        return self
+
     def ts_session(self):
         # update hyper parameters
         self._status.lr = self.config.ts_lr
@@ -87,13 +119,16 @@ class Trainer(BaseTrainer, ABC):
 
     def get_distance_loss(self, atom_logits, bond_logits, batch):
 
+        masks = batch.masks
         # modify data shapes to accommodate different tasks
         if self.config.task_type == 'regression' and self.config.regression_with_variance:
             atom_logits = atom_logits.view(-1, self.config.n_tasks, 2)  # mean and var for the last dimension
             bond_logits = bond_logits.view(-1, self.config.n_tasks, 2)  # mean and var for the last dimension
+            masks = masks.unsqueeze(-1)
 
-        loss = F.mse_loss(atom_logits, bond_logits)
-        loss = torch.sum(loss * batch.masks) / batch.masks.sum()
+        # element-wise squared distance averaged over the labeled entries only
+        diff = atom_logits - bond_logits
+        loss = torch.sum(diff * diff * masks) / masks.expand_as(diff).sum().clamp_min(1)
         return loss
 
     def inference(self, dataset, **kwargs):
@@ -106,43 +141,40 @@ class Trainer(BaseTrainer, ABC):
         self.model.to(self._device)
         self.eval_mode()
 
-        atom_logits_list = list()
-        bond_logits_list = list()
+        logits_list = list()
 
         with torch.no_grad():
             for batch in dataloader:
-                batch.to(self.config.device)
+                batch.to(self._device, non_blocking=True)
                 atom_logits, bond_logits = self.model(batch)
+                logits_list.append(self.merge_branch_logits(atom_logits, bond_logits).detach().cpu())
 
-                atom_logits_list.append(atom_logits.to(torch.float).detach().cpu())
-                bond_logits_list.append(bond_logits.to(torch.float).detach().cpu())
-
-        atom_logits = torch.cat(atom_logits_list, dim=0).numpy()
-        bond_logits = torch.cat(bond_logits_list, dim=0).numpy()
+        logits = torch.cat(logits_list, dim=0).numpy()
 
-        return atom_logits, bond_logits
+        return logits
 
-    def process_logits(self, logits: tuple[np.ndarray, np.ndarray]):
+    def merge_branch_logits(self, atom_logits: torch.Tensor, bond_logits: torch.Tensor) -> torch.Tensor:
+        """
+        Average the outputs of the atom and bond branches on the model device so that
+        only one tensor is copied back to host per batch.
 
-        atom_logits, bond_logits = logits
+        For classification, the branches are averaged after the sigmoid function and the returned
+        values are probabilities; for regression, the raw logits are averaged.
+        """
+        atom_logits = atom_logits.to(torch.float)
+        bond_logits = bond_logits.to(torch.float)
 
         if self.config.task_type == 'classification':
-
-            atom_preds = expit(atom_logits)  # sigmoid function
-            bond_preds = expit(bond_logits)  # sigmoid function
-            return (atom_preds + bond_preds) / 2
-
+            return torch.sigmoid(atom_logits).add_(torch.sigmoid(bond_logits)).mul_(0.5)
         elif self.config.task_type == 'regression':
-            logits = (atom_logits + bond_logits) / 2
-
-            if self.config.n_tasks > 1:
-                logits = logits.reshape(-1, self.config.n_tasks, 2)
-
-            if self.config.regression_with_variance:
-                mean = logits[..., 0]
-                var = F.softplus(torch.from_numpy(logits[..., 1])).numpy()
-                return mean, var
-            else:
-                return logits
+            return atom_logits.add_(bond_logits).mul_(0.5)
         else:
             raise ValueError(f"Unrecognized task type: {self.config.task_type}")
+
+    def process_logits(self, logits: np.ndarray):
+
+        # classification outputs are already converted to probabilities during inference
+        if self.config.task_type == 'classification':
+            return logits
+
+        return super().process_logits(logits)
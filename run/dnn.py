@@ -16,7 +16,7 @@ from datetime import datetime
 from transformers import HfArgumentParser, set_seed
 
 from muben.utils.io import set_logging, set_log_path
-from muben.dnn.dataset import Dataset
+from muben.dnn.dataset import Dataset, close_feature_pool
 from muben.dnn.args import Arguments, Config
 from muben.dnn.train import Trainer
 
@@ -49,6 +49,7 @@ def main(args: Arguments):
         config=config,
         partition="test"
     )
+    close_feature_pool()
 
     trainer = Trainer(
         config=config,
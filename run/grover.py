@@ -9,6 +9,10 @@
 
 import os
 import sys
+
+# load CUDA kernels on first use rather than all at once during initialization
+os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
+
 import wandb
 import logging
 from rdkit import RDLogger